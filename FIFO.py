@@ -1,39 +1,203 @@
-from collections import deque
+import sys
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 
-def is_in_array(arr, value):
-    """Check if a value is in an array"""
-    return value in arr
+_header_cache = {}  # page_count -> formatted table header
 
 def print_table_header(page_count):
     """Print table header"""
-    print("\n" + "+------+" + "-------+" * page_count + "--------+")
-    print("| Time |", end="")
-    for i in range(page_count):
-        print(f" Frame {i+1} |", end="")
-    print(" Page  |")
-    
-    print("|      |", end="")
-    for i in range(page_count):
-        print("       |", end="")
-    print(" Fault |")
-    
-    print("+------+" + "-------+" * page_count + "--------+")
+    header = _header_cache.get(page_count)
+    if header is None:
+        sep = "+------+" + "-------+" * page_count + "--------+"
+        lines = ["\n" + sep]
+        
+        parts = ["| Time |"]
+        for i in range(page_count):
+            parts.append(f" Frame {i+1} |")
+        parts.append(" Page  |")
+        lines.append("".join(parts))
+        
+        lines.append("|      |" + "       |" * page_count + " Fault |")
+        
+        lines.append(sep)
+        header = _header_cache[page_count] = "\n".join(lines) + "\n"
+    sys.stdout.write(header)
 
-def print_table_row(time, total_page, page_count, row, page_fault):
-    """Print one row of the table"""
-    print(f"| {time:4d} |", end="")
+def print_table_row(time, total_page, page_count, row, page_fault, filled):
+    """Print one row of the table; frames from index filled on are empty"""
+    parts = [f"| {time:4d} |"]
     
-    for j in range(page_count):
-        if total_page[j][row] == -1:
-            print(f" {'-':6} |", end="")
+    start = row * page_count
+    for j in range(start, start + page_count):
+        if j - start >= filled:
+            parts.append(f" {'-':6} |")
         else:
-            print(f" {total_page[j][row]:6d} |", end="")
+            parts.append(f" {total_page[j]:6d} |")
     
     if page_fault == 1:
-        print(f" {'Yes':5}  |", end="")
+        parts.append(f" {'Yes':5}  |")
     else:
-        print(f" {'No':5}  |", end="")
-    print()
+        parts.append(f" {'No':5}  |")
+    sys.stdout.write("".join(parts) + "\n")
+
+_frames_template_cache = {}  # page_count -> "[{}] [{}] ..." format string
+
+def frames_template(page_count):
+    """Return the memory-frames format string for page_count frames"""
+    tmpl = _frames_template_cache.get(page_count)
+    if tmpl is None:
+        tmpl = _frames_template_cache[page_count] = " ".join(["[{}]"] * page_count)
+    return tmpl
+
+def parse_references(text):
+    """Parse a whitespace-separated reference string into an array of ints.
+    
+    Works for a single input line or a whole trace file read at once;
+    raises ValueError on a non-integer token and OverflowError on one
+    that does not fit in 64 bits.
+    """
+    return array("q", map(int, text.split()))
+
+Stats = namedtuple("Stats", ["faults", "accesses", "fault_rate"])
+
+def make_stats(faults, accesses):
+    """Build Stats, computing the fault rate (in percent) once"""
+    fault_rate = (faults / accesses) * 100 if accesses else 0.0
+    return Stats(faults, accesses, fault_rate)
+
+def _check_page_count(page_count):
+    """Raise ValueError unless page_count is a positive int (bools rejected)"""
+    if isinstance(page_count, bool) or not isinstance(page_count, int) or page_count < 1:
+        raise ValueError(f"frame counts must be positive integers, got {page_count!r}")
+
+def fifo_page_replacement_iter(ref, page_count):
+    """Run FIFO one reference at a time, for step-by-step display.
+    
+    Yields (page, fault, slot, evicted, frames) for each reference. slot
+    is the frame holding the page after the step (the frame it was loaded
+    into on a fault) and evicted is the page it replaced (None when the
+    frame was empty or there was no fault). frames is the live frame
+    buffer, so copy it if it must outlive the step. Batch callers should
+    use fifo_page_replacement() or count_page_faults() instead.
+    """
+    _check_page_count(page_count)
+    frames = array("q", [-1]) * page_count
+    slot_of = {}  # Resident page -> frame index
+    head = 0
+    filled = 0  # Occupied frames; -1 is a valid page, not just "empty"
+    
+    for page in ref:
+        slot = slot_of.get(page, -1)
+        if slot != -1:
+            yield page, False, slot, None, frames
+            continue
+        
+        # Page fault: load into the frame holding the oldest page
+        slot = head
+        if filled == page_count:
+            evicted = frames[slot]
+            del slot_of[evicted]
+        else:
+            evicted = None
+            filled += 1
+        frames[slot] = page
+        slot_of[page] = slot
+        head = (head + 1) % page_count
+        yield page, True, slot, evicted, frames
+
+def _fifo_run(ref, page_count, page_fault=None, history=None):
+    """FIFO kernel shared by the batch entry points.
+    
+    Returns the number of page faults. page_fault (a bytearray of len(ref))
+    and history (a flat array of len(ref) * page_count) are filled in when
+    given; with neither, the loop only counts.
+    
+    fifo_page_replacement_iter() applies the same eviction rule one step at
+    a time for display. Driving this loop through it (or through a shared
+    per-step function) measured about 2x slower on large traces, so the
+    batch path keeps its own loop; the tests check that both agree.
+    """
+    slot_of = {}  # Resident page -> frame index
+    head = 0
+    filled = 0  # Occupied frames; -1 is a valid page, not just "empty"
+    number_page_fault = 0
+    row = 0
+    
+    if history is None:
+        # Eviction reads frames[head] back; a list measured faster for that
+        frames = [-1] * page_count
+    else:
+        frames = array("q", [-1]) * page_count  # Copied into history by slice
+    
+    for i, page in enumerate(ref):
+        if page not in slot_of:
+            number_page_fault += 1
+            if page_fault is not None:
+                page_fault[i] = 1
+            if filled == page_count:
+                del slot_of[frames[head]]
+            else:
+                filled += 1
+            frames[head] = page
+            slot_of[page] = head
+            head = (head + 1) % page_count
+        if history is not None:
+            history[row:row + page_count] = frames
+            row += page_count
+    return number_page_fault
+
+def fifo_page_replacement(ref, page_count, return_history=True):
+    """Run FIFO over the whole reference sequence.
+    
+    Returns (stats, page_fault, history) where stats is a Stats tuple,
+    page_fault[i] is 1 if reference i faulted and history is a flat array of
+    n * page_count entries; the page_count entries starting at
+    i * page_count are the frame state after reference i (-1 for an
+    empty frame). history is None when return_history is False.
+    Notes for display are derived from these by the caller.
+    """
+    _check_page_count(page_count)
+    n = len(ref)
+    page_fault = bytearray(n)
+    history = array("q", [-1]) * (n * page_count) if return_history else None
+    number_page_fault = _fifo_run(ref, page_count, page_fault, history)
+    return make_stats(number_page_fault, n), page_fault, history
+
+def count_page_faults(ref, page_count):
+    """Count FIFO page faults without building history or notes"""
+    _check_page_count(page_count)
+    return _fifo_run(ref, page_count)
+
+_sweep_ref = None  # Trace for fifo_sweep pool workers, set once per process
+
+def _init_sweep_worker(ref):
+    """Pool initializer: receive the trace once instead of once per task"""
+    global _sweep_ref
+    _sweep_ref = ref
+
+def _sweep_count(page_count):
+    """Pool task: count faults on the worker's trace for one frame count"""
+    return count_page_faults(_sweep_ref, page_count)
+
+def fifo_sweep(ref, page_counts, workers=1):
+    """Count page faults for each frame count in page_counts.
+    
+    Each frame count is an independent run over the same references. With
+    workers=1 they run one after another in this process; otherwise they
+    are spread over a process pool of that many workers (None means one
+    per CPU, as in ProcessPoolExecutor). Raises ValueError if a frame
+    count is not a positive integer.
+    """
+    page_counts = list(page_counts)
+    for page_count in page_counts:
+        _check_page_count(page_count)  # Fail before starting any workers
+    
+    if workers == 1:
+        return [count_page_faults(ref, page_count) for page_count in page_counts]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker,
+                             initargs=(ref,)) as pool:
+        return list(pool.map(_sweep_count, page_counts))
 
 def main():
     print("========================================")
@@ -63,84 +227,62 @@ def main():
             print("Please enter an integer!")
     
     # Input reference sequence
-    ref = []
     print(f"Enter reference sequence ({n} numbers, separated by space): ", end="")
     
     while True:
         try:
-            ref_input = input().split()
-            if len(ref_input) == n:
-                ref = [int(x) for x in ref_input]
-                break
-            else:
+            line = input()
+            if len(line.split()) != n:
                 print(f"Please enter exactly {n} numbers! Enter again: ", end="")
+                continue
+            ref = parse_references(line)
+            break
         except ValueError:
             print("Please enter integers only! Enter again: ", end="")
+        except OverflowError:
+            # Pages are stored as signed 64-bit values
+            print(f"Page numbers must be between {-2**63} and {2**63 - 1}! Enter again: ", end="")
     
-    # Initialize arrays
-    pre_array = [-1] * page_count  # -1 represents empty frame
-    page_fault = [0] * n
-    total_page = [[-1 for _ in range(n)] for _ in range(page_count)]
-    
+    total_page = array("q", [-1]) * (n * page_count)  # Row i: frames after time i
+    page_fault = bytearray(n)
     number_page_fault = 0
-    current_page = 0
     
     print("\n========================================")
     print("           EXECUTION PROCESS")
     print("========================================")
     
     # Main loop processing each reference
-    for i in range(n):
-        print(f"\n--- Time {i+1}: Reference to page {ref[i]} ---")
+    steps = fifo_page_replacement_iter(ref, page_count)
+    for i, (page, fault, slot, evicted, frames) in enumerate(steps):
+        print(f"\n--- Time {i+1}: Reference to page {page} ---")
         
-        # Check if page is already in memory
-        if is_in_array(pre_array, ref[i]):
-            # Page is already in memory
-            page_fault[i] = 0
-            print(f"Page {ref[i]} is already in memory. No page fault.")
-        else:
-            # Page is not in memory - page fault occurs
+        if fault:
             number_page_fault += 1
             page_fault[i] = 1
             
-            print(f"Page fault! Page {ref[i]} is not in memory.")
-            
-            # Check if memory is full
-            if current_page == page_count:
-                current_page = 0  # Return to beginning (FIFO)
-                print(f"Memory is full. Replace page at frame {current_page + 1}.")
+            print(f"Page fault! Page {page} is not in memory.")
+            if evicted is None:
+                print(f"Empty frame available. Add to frame {slot + 1}.")
             else:
-                print(f"Empty frame available. Add to frame {current_page + 1}.")
-            
-            # Add new page to memory
-            pre_array[current_page] = ref[i]
-            
-            # Increment current_page for next time
-            current_page = (current_page + 1) % page_count
+                print(f"Memory is full. Replace page at frame {slot + 1}.")
+        else:
+            print(f"Page {page} is already in memory. No page fault.")
         
         # Update status table
-        if i == 0:
-            # First time point
-            for j in range(page_count):
-                total_page[j][i] = pre_array[j]
-        else:
-            # Copy from previous state
-            for j in range(page_count):
-                total_page[j][i] = total_page[j][i-1]
-            
-            # Update with latest state
-            for j in range(page_count):
-                if pre_array[j] != -1:
-                    total_page[j][i] = pre_array[j]
+        total_page[i * page_count:(i + 1) * page_count] = frames
         
-        # Print current state
-        print("Current memory state: ", end="")
-        for j in range(page_count):
-            if pre_array[j] == -1:
-                print("[ ] ", end="")
+        # Print current state; frames fill in order, so the first
+        # min(faults, page_count) are occupied
+        filled = min(number_page_fault, page_count)
+        parts = ["Current memory state: "]
+        for j, frame in enumerate(frames):
+            if j >= filled:
+                parts.append("[ ] ")
             else:
-                print(f"[{pre_array[j]}] ", end="")
-        print()
+                parts.append(f"[{frame}] ")
+        sys.stdout.write("".join(parts) + "\n")
+    
+    stats = make_stats(number_page_fault, n)
     
     # Print detailed result table
     print("\n========================================")
@@ -149,13 +291,17 @@ def main():
     
     print_table_header(page_count)
     
+    sep = "+------+" + "-------+" * page_count + "--------+"
+    filled = 0
     for i in range(n):
-        print_table_row(i + 1, total_page, page_count, i, page_fault[i])
+        if page_fault[i] and filled < page_count:
+            filled += 1
+        print_table_row(i + 1, total_page, page_count, i, page_fault[i], filled)
         
         if i < n - 1:
-            print("+------+" + "-------+" * page_count + "--------+")
+            print(sep)
     
-    print("+------+" + "-------+" * page_count + "--------+")
+    print(sep)
     
     # Summary results
     print("\n========================================")
@@ -173,11 +319,10 @@ def main():
         print("Page fault positions: None")
     
     # Print total number of page faults
-    print(f"Total number of page faults: {number_page_fault}")
+    print(f"Total number of page faults: {stats.faults}")
     
-    # Calculate page fault rate
-    fault_rate = (number_page_fault / n) * 100
-    print(f"Page fault rate: {fault_rate:.2f}%")
+    # Print page fault rate
+    print(f"Page fault rate: {stats.fault_rate:.2f}%")
     
     # Display explanation
     print("\n========================================")
@@ -206,43 +351,38 @@ def visualize_fifo_example():
     print()
     
     # Initialize
-    frames = [-1] * page_count
+    cells = [" "] * page_count  # Display text of each frame
     page_faults = 0
-    queue = []  # Queue to track entry order
+    
+    frames_tmpl = frames_template(page_count)
     
     print("Step | Reference |  Memory Frames | Page Fault | Note")
     print("-" * 60)
     
-    for i, page in enumerate(ref):
-        fault = False
+    steps = fifo_page_replacement_iter(ref, page_count)
+    for i, (page, fault, slot, evicted, _) in enumerate(steps):
         note = ""
         
-        if page not in frames:
+        if fault:
             page_faults += 1
-            fault = True
+            cells[slot] = page
             
-            if -1 in frames:
+            if evicted is None:
                 # Empty frame available
-                empty_idx = frames.index(-1)
-                frames[empty_idx] = page
-                queue.append(page)
-                note = f"Add to frame {empty_idx + 1}"
+                note = f"Add to frame {slot + 1}"
             else:
                 # Replace page
-                oldest = queue.pop(0)
-                idx = frames.index(oldest)
-                frames[idx] = page
-                queue.append(page)
-                note = f"Replace page {oldest} at frame {idx + 1}"
+                note = f"Replace page {evicted} at frame {slot + 1}"
         
         # Display result
-        frames_display = " ".join([f"[{f}]" if f != -1 else "[ ]" for f in frames])
+        frames_display = frames_tmpl.format(*cells)
         fault_display = "Yes" if fault else "No"
         print(f"{i+1:4d} | {page:9d} | {frames_display:13s} | {fault_display:9s} | {note}")
     
     print("-" * 60)
-    print(f"Total number of page faults: {page_faults}")
-    print(f"Page fault rate: {(page_faults/n)*100:.2f}%")
+    stats = make_stats(page_faults, n)
+    print(f"Total number of page faults: {stats.faults}")
+    print(f"Page fault rate: {stats.fault_rate:.2f}%")
 
 if __name__ == "__main__":
     print("Select mode:")
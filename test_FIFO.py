@@ -0,0 +1,196 @@
+import io
+import random
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import FIFO
+
+def naive_fifo(ref, page_count):
+    """Straightforward FIFO used as the reference: (page_fault, history)"""
+    frames = [-1] * page_count
+    queue = []
+    page_fault = []
+    history = []
+    for page in ref:
+        if page in queue:
+            page_fault.append(0)
+        else:
+            page_fault.append(1)
+            if len(queue) < page_count:
+                frames[len(queue)] = page
+            else:
+                frames[frames.index(queue.pop(0))] = page
+            queue.append(page)
+        history.append(list(frames))
+    return page_fault, history
+
+class FifoPageReplacementTest(unittest.TestCase):
+    def test_count_page_faults_matches_naive_fifo(self):
+        rng = random.Random(1)
+        for page_count in (1, 2, 3, 5, 8):
+            ref = [rng.randrange(-3, 12) for _ in range(200)]
+            expected_fault, _ = naive_fifo(ref, page_count)
+            self.assertEqual(FIFO.count_page_faults(ref, page_count), sum(expected_fault))
+    
+    def test_belady_anomaly(self):
+        ref = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+        self.assertEqual(FIFO.count_page_faults(ref, 3), 9)
+        self.assertEqual(FIFO.count_page_faults(ref, 4), 10)
+    
+    def test_matches_naive_fifo(self):
+        rng = random.Random(0)
+        for page_count in (1, 2, 3, 5, 8):
+            ref = [rng.randrange(-3, 12) for _ in range(200)]
+            stats, page_fault, history = FIFO.fifo_page_replacement(ref, page_count)
+            expected_fault, expected_history = naive_fifo(ref, page_count)
+            self.assertEqual(list(page_fault), expected_fault)
+            rows = [history[i * page_count:(i + 1) * page_count].tolist()
+                    for i in range(len(ref))]
+            self.assertEqual(rows, expected_history)
+            self.assertEqual(stats.faults, sum(expected_fault))
+            self.assertEqual(stats.accesses, len(ref))
+    
+    def test_without_history(self):
+        stats, page_fault, history = FIFO.fifo_page_replacement(
+            [7, 0, 1, 2, 0], 3, return_history=False)
+        self.assertIsNone(history)
+        self.assertEqual(list(page_fault), [1, 1, 1, 1, 0])
+        self.assertEqual(stats.faults, 4)
+    
+    def test_count_page_faults_matches_kernel(self):
+        rng = random.Random(2)
+        ref = [rng.randrange(-3, 40) for _ in range(2000)]
+        for page_count in (1, 4, 16, 48):
+            self.assertEqual(FIFO.count_page_faults(ref, page_count),
+                             FIFO.fifo_page_replacement(ref, page_count)[0].faults)
+    
+    def test_stats(self):
+        self.assertEqual(FIFO.make_stats(10, 12), (10, 12, 10 / 12 * 100))
+        self.assertEqual(FIFO.make_stats(0, 0).fault_rate, 0.0)
+    
+    def test_iter_reports_slot_and_evicted(self):
+        steps = [step[:4] for step in FIFO.fifo_page_replacement_iter([1, 2, 1, 3], 2)]
+        self.assertEqual(steps, [
+            (1, True, 0, None),
+            (2, True, 1, None),
+            (1, False, 0, None),
+            (3, True, 0, 1),
+        ])
+    
+    def test_iter_matches_kernel(self):
+        rng = random.Random(3)
+        ref = [rng.randrange(-3, 20) for _ in range(500)]
+        for page_count in (1, 3, 7):
+            _, page_fault, history = FIFO.fifo_page_replacement(ref, page_count)
+            steps = list(FIFO.fifo_page_replacement_iter(ref, page_count))
+            self.assertEqual([int(step[1]) for step in steps], list(page_fault))
+            self.assertEqual(steps[-1][4].tolist(), history[-page_count:].tolist())
+    
+    def test_page_minus_one_is_a_real_page(self):
+        stats, page_fault, _ = FIFO.fifo_page_replacement([-1, 5, -1, 5, 6, -1], 3)
+        self.assertEqual(list(page_fault), [1, 1, 0, 0, 1, 0])
+        self.assertEqual(stats.faults, 3)
+        self.assertEqual(FIFO.count_page_faults([-1, 5, -1, 5, 6, -1], 3), 3)
+    
+    def test_rejects_bad_frame_counts(self):
+        for page_count in (0, -2, 1.0, True):
+            with self.assertRaises(ValueError):
+                FIFO.count_page_faults([1, 2], page_count)
+            with self.assertRaises(ValueError):
+                FIFO.fifo_page_replacement([1, 2], page_count)
+            with self.assertRaises(ValueError):
+                list(FIFO.fifo_page_replacement_iter([1, 2], page_count))
+
+class ParseReferencesTest(unittest.TestCase):
+    def test_parses_whitespace_separated_ints(self):
+        self.assertEqual(FIFO.parse_references(" 7 0\n-1\t3 ").tolist(), [7, 0, -1, 3])
+        self.assertEqual(len(FIFO.parse_references("")), 0)
+    
+    def test_rejects_non_integer(self):
+        for text in ("1 a 3", "1.5", "0x10"):
+            with self.assertRaises(ValueError):
+                FIFO.parse_references(text)
+    
+    def test_rejects_out_of_range(self):
+        with self.assertRaises(OverflowError):
+            FIFO.parse_references("1 99999999999999999999")
+
+class FifoSweepTest(unittest.TestCase):
+    def test_serial_and_parallel_agree(self):
+        rng = random.Random(4)
+        ref = FIFO.parse_references(" ".join(str(rng.randrange(30)) for _ in range(3000)))
+        page_counts = [1, 2, 3, 5, 8, 13]
+        serial = FIFO.fifo_sweep(ref, page_counts)
+        self.assertEqual(serial, [FIFO.count_page_faults(ref, c) for c in page_counts])
+        self.assertEqual(FIFO.fifo_sweep(ref, page_counts, workers=2), serial)
+    
+    def test_rejects_bad_frame_counts(self):
+        for page_counts in ([3, 0], [-1], [2.5], [True]):
+            with self.assertRaises(ValueError):
+                FIFO.fifo_sweep([1, 2, 3], page_counts)
+
+class DisplayTest(unittest.TestCase):
+    def run_main(self, *lines):
+        out = io.StringIO()
+        with mock.patch("builtins.input", side_effect=lines), redirect_stdout(out):
+            FIFO.main()
+        return out.getvalue()
+    
+    def test_example_steps(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            FIFO.visualize_fifo_example()
+        lines = out.getvalue().splitlines()
+        start = lines.index("-" * 60) + 1
+        self.assertEqual(lines[start:start + 12], [
+            "   1 |         7 | [7] [ ] [ ]   | Yes       | Add to frame 1",
+            "   2 |         0 | [7] [0] [ ]   | Yes       | Add to frame 2",
+            "   3 |         1 | [7] [0] [1]   | Yes       | Add to frame 3",
+            "   4 |         2 | [2] [0] [1]   | Yes       | Replace page 7 at frame 1",
+            "   5 |         0 | [2] [0] [1]   | No        | ",
+            "   6 |         3 | [2] [3] [1]   | Yes       | Replace page 0 at frame 2",
+            "   7 |         0 | [2] [3] [0]   | Yes       | Replace page 1 at frame 3",
+            "   8 |         4 | [4] [3] [0]   | Yes       | Replace page 2 at frame 1",
+            "   9 |         2 | [4] [2] [0]   | Yes       | Replace page 3 at frame 2",
+            "  10 |         3 | [4] [2] [3]   | Yes       | Replace page 0 at frame 3",
+            "  11 |         0 | [0] [2] [3]   | Yes       | Replace page 4 at frame 1",
+            "  12 |         3 | [0] [2] [3]   | No        | ",
+        ])
+        self.assertIn("Total number of page faults: 10", lines)
+        self.assertIn("Page fault rate: 83.33%", lines)
+    
+    def test_main_reports_replacement_once_memory_is_full(self):
+        out = self.run_main("2", "4", "1 2 3 1")
+        self.assertIn("Empty frame available. Add to frame 1.", out)
+        self.assertIn("Empty frame available. Add to frame 2.", out)
+        self.assertIn("Memory is full. Replace page at frame 1.", out)
+        self.assertIn("Memory is full. Replace page at frame 2.", out)
+        self.assertIn("Total number of page faults: 4", out)
+    
+    def test_main_reference_input_validation(self):
+        out = self.run_main("3", "3", "x 1", "1 x 2", "1 2 3")
+        self.assertIn("Please enter exactly 3 numbers!", out)
+        self.assertIn("Please enter integers only!", out)
+        self.assertIn("Reference sequence: 1 2 3", out)
+    
+    def test_main_reports_page_range(self):
+        out = self.run_main("2", "2", "1 %d" % 2**63, "1 2")
+        self.assertIn("Page numbers must be between -9223372036854775808 and "
+                      "9223372036854775807!", out)
+        self.assertNotIn("Please enter integers only!", out)
+    
+    def test_main_accepts_negative_pages(self):
+        out = self.run_main("3", "6", "-5 3 -5 3 9 -5")
+        self.assertIn("Current memory state: [-5] [ ] [ ] ", out)
+        self.assertIn("Current memory state: [-5] [3] [9] ", out)
+        self.assertIn("Total number of page faults: 3", out)
+    
+    def test_main_shows_page_minus_one(self):
+        out = self.run_main("2", "3", "-1 -1 4")
+        self.assertIn("Current memory state: [-1] [ ] ", out)
+        self.assertIn("Current memory state: [-1] [4] ", out)
+        self.assertIn("|    2 |     -1 | -      | No     |", out)
+
+if __name__ == "__main__":
+    unittest.main()